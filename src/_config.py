@@ -2,15 +2,33 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+# (abspath, st_mtime_ns, st_size) -> parsed config
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
 
 
 def load_automation_config(config_path: str = "automation.config") -> Dict[str, Any]:
     """
     Load JSON config. If file doesn't exist, returns {}.
     Expected JSON keys: automation_id (int), schema_name, table_name, path_mode
+
+    Parsed configs are cached until the file's mtime or size changes.
     """
-    if not os.path.exists(config_path):
+    abs_path = os.path.abspath(config_path)
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        # missing, a path through a non-directory, unreadable, ...
         return {}
-    with open(config_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+
+    key = (abs_path, st.st_mtime_ns, st.st_size)
+    cfg = _CONFIG_CACHE.get(key)
+    if cfg is None:
+        with open(abs_path, "r", encoding="utf-8") as f:
+            cfg = json.load(f)
+        # drop entries for older versions of the same file
+        for stale in [k for k in _CONFIG_CACHE if k[0] == abs_path]:
+            del _CONFIG_CACHE[stale]
+        _CONFIG_CACHE[key] = cfg
+    return dict(cfg)
@@ -1,28 +1,52 @@
 from __future__ import annotations
 
+import functools
 import os
 import platform
 import socket
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
-def get_host_context() -> Dict[str, Any]:
-    """Host/device context for troubleshooting across multiple servers."""
-    host_name = socket.gethostname()
-    fqdn = socket.getfqdn()
+@functools.lru_cache(maxsize=1)
+def _cached_hostname() -> str:
+    return socket.gethostname()
+
 
-    host_ip = None
+@functools.lru_cache(maxsize=1)
+def _cached_fqdn() -> str:
+    # getfqdn() does a reverse-DNS lookup that can stall for seconds on macOS
+    # and off-domain hosts; a ".local" hostname is already as qualified as it gets.
+    host_name = _cached_hostname()
+    if host_name.endswith(".local"):
+        return host_name
+    return socket.getfqdn()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_hostbyname(name: str) -> Optional[str]:
     try:
-        host_ip = socket.gethostbyname(host_name)
+        return socket.gethostbyname(name)
     except Exception:
-        host_ip = None
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _build_host_context() -> Dict[str, Any]:
+    host_name = _cached_hostname()
 
     return {
         "host_name": host_name,
         "computername": os.getenv("COMPUTERNAME"),
-        "fqdn": fqdn,
-        "host_ip": host_ip,
+        "fqdn": _cached_fqdn(),
+        "host_ip": _cached_hostbyname(host_name),
         "platform": platform.platform(),
         "python": sys.version,
     }
+
+
+def get_host_context() -> Dict[str, Any]:
+    """Host/device context for troubleshooting across multiple servers."""
+    # None of this changes during the life of the process, so build it once and
+    # hand out copies the caller is free to mutate.
+    return _build_host_context().copy()
@@ -1,17 +1,55 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable, Dict
+
+import orjson
+
+# Non-str keys are stringified (like json.dumps); naive datetimes nested in
+# payloads are treated as UTC, matching jsonable().
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _datetime_to_iso(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+# Exact-type fast path; subclasses fall through to the isinstance checks.
+_JSONABLE_DISPATCH: Dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    list: _identity,
+    dict: _identity,
+    datetime: _datetime_to_iso,
+}
 
 
 def jsonable(value: Any) -> Any:
     """Make values JSON-serializable, with forgiving fallbacks."""
-    if value is None:
-        return None
+    fn = _JSONABLE_DISPATCH.get(type(value))
+    if fn is not None:
+        return fn(value)
     if isinstance(value, (str, int, float, bool, list, dict)):
         return value
     if isinstance(value, datetime):
-        if value.tzinfo is None:
-            value = value.replace(tzinfo=timezone.utc)
-        return value.isoformat()
+        return _datetime_to_iso(value)
     return str(value)
+
+
+def dumps(value: Any) -> str:
+    """Encode to a JSON string (UTF-8, non-ASCII left as-is)."""
+    try:
+        return orjson.dumps(value, option=_ORJSON_OPTIONS).decode("utf-8")
+    except (orjson.JSONEncodeError, TypeError):
+        # e.g. ints wider than 64 bits, which orjson refuses but json handles
+        return json.dumps(value, ensure_ascii=False, default=str)
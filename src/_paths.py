@@ -1,43 +1,78 @@
 from __future__ import annotations
 
 import os
+import stat
 import sys
-from typing import Optional
+from typing import Dict, Optional
+
+# Frames from these directories are never the entry script: this package itself
+# and the stdlib (located via os.py, which avoids importing sysconfig).
+_SKIP_DIRS = tuple(
+    os.path.join(os.path.dirname(os.path.abspath(path)), "")
+    for path in (__file__, os.__file__)
+)
+
+
+def _fast_abspath(p: str, cwd: str) -> str:
+    """os.path.abspath without the getcwd() call on every invocation."""
+    if os.path.isabs(p):
+        return os.path.normpath(p)
+    return os.path.normpath(os.path.join(cwd, p))
 
 
 def resolve_entry_script_path(explicit: Optional[str] = None) -> Optional[str]:
+    cwd = os.getcwd()
+
+    # One stat per distinct candidate; __main__.__file__ and sys.argv[0] are
+    # usually the same file.
+    stat_cache: Dict[str, bool] = {}
+
+    def _is_file(p: str) -> bool:
+        v = stat_cache.get(p)
+        if v is None:
+            try:
+                v = stat.S_ISREG(os.stat(p).st_mode)
+            except (OSError, ValueError):
+                v = False
+            stat_cache[p] = v
+        return v
+
     if explicit:
-        p = os.path.abspath(explicit)
-        return p if os.path.isfile(p) else None
+        p = _fast_abspath(explicit, cwd)
+        return p if _is_file(p) else None
 
     # 1) __main__.__file__ (best signal for normal execution)
     try:
         import __main__  # type: ignore
         main_file = getattr(__main__, "__file__", None)
         if main_file:
-            p = os.path.abspath(main_file)
-            if os.path.isfile(p):
+            p = _fast_abspath(main_file, cwd)
+            if _is_file(p):
                 return p
     except Exception:
         pass
 
     # 2) sys.argv[0]
     if sys.argv and sys.argv[0]:
-        p = os.path.abspath(sys.argv[0])
-        if os.path.isfile(p):
+        p = _fast_abspath(sys.argv[0], cwd)
+        if _is_file(p):
             return p
 
-    # 3) stack inspection fallback (optional, but convenient)
+    # 3) stack walk fallback (optional, but convenient)
+    # Walk raw frames rather than inspect.stack(), which resolves source
+    # files/lines (and stats them) for every frame on the stack.
     try:
-        for frame_info in inspect.stack():
-            filename = frame_info.filename
+        f = sys._getframe(1)
+        while f is not None:
+            filename = f.f_code.co_filename
+            f = f.f_back
             # ignore stdlib + this package frames
             if not filename:
                 continue
-            if "automation_logger" in filename.replace("\\", "/"):
+            p = _fast_abspath(filename, cwd)
+            if p.startswith(_SKIP_DIRS):
                 continue
-            p = os.path.abspath(filename)
-            if os.path.isfile(p):
+            if _is_file(p):
                 return p
     except Exception:
         pass
@@ -49,9 +84,11 @@ def resolve_path(path_mode: str, script_path: Optional[str]) -> str:
     """
     path_mode:
       - 'cwd': current working directory (default)
-      - 'script': directory of the calling script (requires script_path)
+      - 'script': directory of the calling script (requires script_path, which
+        must already be absolute, as returned by resolve_entry_script_path)
     """
     path_mode = (path_mode or "cwd").strip().lower()
     if path_mode == "script" and script_path:
-        return os.path.dirname(os.path.abspath(script_path))
+        assert os.path.isabs(script_path), script_path
+        return os.path.dirname(script_path)
     return os.getcwd()
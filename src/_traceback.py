@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import builtins
+from typing import Iterable, Iterator, List, Optional, Set, Union
+
+_CAUSE = "\nThe above exception was the direct cause of the following exception:\n\n"
+_CONTEXT = "\nDuring handling of the above exception, another exception occurred:\n\n"
+
+# Same as traceback._RECURSIVE_CUTOFF: identical frames past this are collapsed.
+_RECURSIVE_CUTOFF = 3
+
+# TracebackException's defaults for exception groups.
+_MAX_GROUP_WIDTH = 15
+_MAX_GROUP_DEPTH = 10
+
+# Python 3.11+; None before that, where no exception is a group.
+_BaseExceptionGroup = getattr(builtins, "BaseExceptionGroup", None)
+
+
+class _PrintContext:
+    """Mirrors traceback._ExceptionPrintContext: group nesting and margins."""
+
+    def __init__(self) -> None:
+        self.group_depth = 0
+        self.need_close = False
+
+    def indent(self) -> str:
+        return " " * (2 * self.group_depth)
+
+    def emit(self, text: Union[str, Iterable[str]], margin_char: str = "|") -> Iterator[str]:
+        prefix = self.indent()
+        if self.group_depth:
+            prefix += margin_char + " "
+        for chunk in [text] if isinstance(text, str) else text:
+            yield "".join(prefix + line for line in chunk.splitlines(keepends=True))
+
+
+def _format_frames(tb, limit: int) -> List[str]:
+    lines: List[str] = []
+    last = None
+    count = 0
+
+    def _flush_repeats() -> None:
+        if count > _RECURSIVE_CUTOFF:
+            repeats = count - _RECURSIVE_CUTOFF
+            lines.append(
+                f"  [Previous line repeated {repeats} more time{'s' if repeats > 1 else ''}]\n"
+            )
+
+    n = 0
+    while tb is not None and n < limit:
+        code = tb.tb_frame.f_code
+        key = (code.co_filename, tb.tb_lineno, code.co_name)
+        if key != last:
+            _flush_repeats()
+            last = key
+            count = 0
+        count += 1
+        if count <= _RECURSIVE_CUTOFF:
+            lines.append('  File "%s", line %d, in %s\n' % key)
+        tb = tb.tb_next
+        n += 1
+    _flush_repeats()
+    return lines
+
+
+def _format_final_line(exc_type: type, exc: BaseException) -> List[str]:
+    stype = exc_type.__qualname__
+    smod = exc_type.__module__
+    if smod not in ("__main__", "builtins"):
+        if not isinstance(smod, str):
+            smod = "<unknown>"
+        stype = f"{smod}.{stype}"
+
+    try:
+        value = str(exc)
+    except Exception:
+        value = "<exception str() failed>"
+
+    lines = [f"{stype}: {value}\n" if value else f"{stype}\n"]
+    for note in getattr(exc, "__notes__", None) or ():
+        lines.append(f"{note}\n")
+    return lines
+
+
+class _Node:
+    """One exception in the cause/context/group tree (like TracebackException)."""
+
+    __slots__ = ("exc_type", "exc", "tb", "cause", "context", "exceptions")
+
+    def __init__(self, exc_type: type, exc: BaseException, tb, seen: Set[int]) -> None:
+        seen.add(id(exc))
+        self.exc_type = exc_type
+        self.exc = exc
+        self.tb = tb
+        self.cause: Optional[_Node] = None
+        self.context: Optional[_Node] = None
+        self.exceptions: Optional[List[_Node]] = None
+
+
+def _build_tree(exc_type: type, exc: BaseException, tb) -> _Node:
+    # Same traversal as TracebackException(compact=True): a LIFO queue and one
+    # shared seen-set, so an exception reachable twice is shown where the
+    # stdlib shows it.
+    seen: Set[int] = set()
+    root = _Node(exc_type, exc, tb, seen)
+    queue = [root]
+    while queue:
+        node = queue.pop()
+        e = node.exc
+
+        cause = e.__cause__
+        if cause is not None and id(cause) not in seen:
+            node.cause = _Node(type(cause), cause, cause.__traceback__, seen)
+
+        context = e.__context__
+        if (
+            node.cause is None
+            and not e.__suppress_context__
+            and context is not None
+            and id(context) not in seen
+        ):
+            node.context = _Node(type(context), context, context.__traceback__, seen)
+
+        if _BaseExceptionGroup is not None and isinstance(e, _BaseExceptionGroup):
+            node.exceptions = [_Node(type(x), x, x.__traceback__, seen) for x in e.exceptions]
+
+        if node.cause is not None:
+            queue.append(node.cause)
+        if node.context is not None:
+            queue.append(node.context)
+        if node.exceptions:
+            queue.extend(node.exceptions)
+    return root
+
+
+def _format_group(node: _Node, limit: int, ctx: _PrintContext) -> Iterator[str]:
+    if ctx.group_depth > _MAX_GROUP_DEPTH:
+        yield from ctx.emit(f"... (max_group_depth is {_MAX_GROUP_DEPTH})\n")
+        return
+
+    is_toplevel = ctx.group_depth == 0
+    if is_toplevel:
+        ctx.group_depth += 1
+
+    if node.tb is not None:
+        yield from ctx.emit(
+            "Exception Group Traceback (most recent call last):\n",
+            margin_char="+" if is_toplevel else "|",
+        )
+        yield from ctx.emit(_format_frames(node.tb, limit))
+    yield from ctx.emit(_format_final_line(node.exc_type, node.exc))
+
+    children = node.exceptions or []
+    n = min(len(children), _MAX_GROUP_WIDTH + 1)
+    ctx.need_close = False
+    for i in range(n):
+        last = i == n - 1
+        if last:
+            # the closing rule may already be emitted by a nested group
+            ctx.need_close = True
+        truncated = i >= _MAX_GROUP_WIDTH
+        title = "..." if truncated else f"{i + 1}"
+        rule = "+-" if i == 0 else "  "
+        yield f"{ctx.indent()}{rule}+---------------- {title} ----------------\n"
+
+        ctx.group_depth += 1
+        if truncated:
+            remaining = len(children) - _MAX_GROUP_WIDTH
+            plural = "s" if remaining > 1 else ""
+            yield from ctx.emit(f"and {remaining} more exception{plural}\n")
+        else:
+            yield from _format_chain(children[i], limit, ctx)
+
+        if last and ctx.need_close:
+            yield ctx.indent() + "+------------------------------------\n"
+            ctx.need_close = False
+        ctx.group_depth -= 1
+
+    if is_toplevel:
+        ctx.group_depth = 0
+
+
+def _format_chain(node: _Node, limit: int, ctx: _PrintContext) -> Iterator[str]:
+    # Collect newest-first, then emit oldest-first like the stdlib.
+    chain = []
+    current: Optional[_Node] = node
+    while current is not None:
+        if current.cause is not None:
+            chain.append((_CAUSE, current))
+            current = current.cause
+        elif current.context is not None:
+            chain.append((_CONTEXT, current))
+            current = current.context
+        else:
+            chain.append((None, current))
+            current = None
+
+    for separator, current in reversed(chain):
+        if separator is not None:
+            yield from ctx.emit(separator)
+        if current.exceptions is not None:
+            yield from _format_group(current, limit, ctx)
+        else:
+            if current.tb is not None:
+                yield from ctx.emit("Traceback (most recent call last):\n")
+                yield from ctx.emit(_format_frames(current.tb, limit))
+            yield from ctx.emit(_format_final_line(current.exc_type, current.exc))
+
+
+def format_exception(exc_type: type, exc: BaseException, tb, limit: int = 50) -> str:
+    """
+    Like "".join(traceback.format_exception(...)), including chained causes and
+    exception groups, but without source lines. Built straight from the
+    traceback objects so linecache is never consulted and no files are opened
+    or stat-ed.
+    """
+    return "".join(_format_chain(_build_tree(exc_type, exc, tb), limit, _PrintContext()))
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from ._json import dumps
+
+if TYPE_CHECKING:
+    from syncforge import WarehouseClient
+
+_COLUMNS = "(automation_id, run_time, context, output, flags, flag_names, success, duration_ms)"
+_ROW_PLACEHOLDER = "(%s, %s, %s::jsonb, %s::jsonb, %s::jsonb, %s::text[], %s, %s)"
+
+# One warehouse connection shared by every logger in the process, opened on
+# first insert and closed at interpreter exit.
+_wh: Optional[WarehouseClient] = None
+# Re-entrant so _drain can hold it across the leftover write and the close.
+_wh_lock = threading.RLock()
+_wh_last_used = 0.0
+
+# A connection idle longer than this is pinged before use, so a stale one
+# (idle timeout, server restart, failover) is replaced before the INSERT.
+_IDLE_CHECK_S = 60.0
+
+
+# syncforge is only imported once a run is actually written.
+_WarehouseClient: Optional[type] = None
+
+
+def _get_warehouse_client_cls() -> type:
+    global _WarehouseClient
+    if _WarehouseClient is None:
+        from syncforge import WarehouseClient
+
+        _WarehouseClient = WarehouseClient
+    return _WarehouseClient
+
+
+def _is_alive(wh: WarehouseClient) -> bool:
+    try:
+        wh.execute_query("SELECT 1;", None, fetch=True, commit=False)
+        return True
+    except Exception:
+        return False
+
+
+def _get_warehouse() -> WarehouseClient:
+    global _wh, _wh_last_used
+    now = time.monotonic()
+    if _wh is not None and now - _wh_last_used > _IDLE_CHECK_S and not _is_alive(_wh):
+        _close_warehouse()
+    if _wh is None:
+        _wh = _get_warehouse_client_cls()().__enter__()
+    _wh_last_used = now
+    return _wh
+
+
+def _close_warehouse() -> None:
+    global _wh
+    wh, _wh = _wh, None
+    if wh is None:
+        return
+    try:
+        wh.__exit__(None, None, None)
+    except Exception:
+        pass
+
+
+def encode_row(
+    automation_id: int,
+    run_time: datetime,
+    context: Optional[Dict[str, Any]],
+    output: Optional[Dict[str, Any]],
+    flags: Optional[Dict[str, Any]],
+    success: bool,
+    duration_ms: int,
+) -> Tuple[Any, ...]:
+    """
+    Build the INSERT params for one run, in _COLUMNS order.
+    Bare flags (value True) go to the flag_names text[] column; only flags
+    carrying meta are kept in the flags jsonb. Empty payloads are sent as NULL.
+    """
+    flags = flags or {}
+    flag_names = [k for k, v in flags.items() if v is True]
+    flag_meta = {k: v for k, v in flags.items() if v is not True}
+
+    return (
+        automation_id,
+        run_time,
+        dumps(context) if context else None,
+        dumps(output) if output else None,
+        dumps(flag_meta) if flag_meta else None,
+        flag_names or None,
+        success,
+        duration_ms,
+    )
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+# (schema_name, table_name) -> "INSERT INTO ... VALUES" head with quoted identifiers.
+_sql_cache: Dict[Tuple[str, str], str] = {}
+
+
+def _insert_head(schema_name: str, table_name: str) -> str:
+    key = (schema_name, table_name)
+    head = _sql_cache.get(key)
+    if head is None:
+        head = (
+            f"INSERT INTO {_quote_ident(schema_name)}.{_quote_ident(table_name)}\n"
+            f"    {_COLUMNS}\n"
+            "VALUES\n"
+            "    "
+        )
+        _sql_cache[key] = head
+    return head
+
+
+def _execute_rows(
+    wh: WarehouseClient, schema_name: str, table_name: str, rows: Sequence[Tuple[Any, ...]]
+) -> None:
+    values = ",\n    ".join([_ROW_PLACEHOLDER] * len(rows))
+    sql = f"{_insert_head(schema_name, table_name)}{values};"
+    params = tuple(v for row in rows for v in row)
+
+    wh.execute_query(sql, params, fetch=False, commit=True)
+
+
+def insert_rows(schema_name: str, table_name: str, rows: Sequence[Tuple[Any, ...]]) -> None:
+    """
+    Insert encoded rows into schema_name.table_name in a single round trip.
+
+    The INSERT is never replayed: it may have committed before the error
+    reached us. Staleness is handled up front by _get_warehouse instead.
+    """
+    if not rows:
+        return
+
+    with _wh_lock:
+        wh = _get_warehouse()
+        try:
+            _execute_rows(wh, schema_name, table_name, rows)
+        except Exception:
+            # Keep the connection after a data error (bad row); drop it only if
+            # it's broken or stuck in an aborted transaction.
+            if not _is_alive(wh):
+                _close_warehouse()
+            raise
+
+
+# Runs are handed to a daemon thread so __exit__ doesn't wait on the warehouse.
+# Queue items are (schema_name, table_name, encoded_row); None stops the worker.
+# The queue is bounded: if the warehouse can't keep up, __exit__ blocks until
+# there is room instead of buffering rows without limit.
+_MAX_BATCH_ROWS = 500
+_MAX_QUEUED_ROWS = 10_000
+_DRAIN_TIMEOUT_S = 30.0
+
+_log_queue: "queue.Queue[Optional[Tuple[str, str, Tuple[Any, ...]]]]" = queue.Queue(
+    maxsize=_MAX_QUEUED_ROWS
+)
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _write_batch(items: Sequence[Tuple[str, str, Tuple[Any, ...]]]) -> None:
+    by_table: Dict[Tuple[str, str], List[Tuple[Any, ...]]] = {}
+    for schema_name, table_name, row in items:
+        by_table.setdefault((schema_name, table_name), []).append(row)
+
+    for (schema_name, table_name), rows in by_table.items():
+        try:
+            insert_rows(schema_name, table_name, rows)
+            continue
+        except Exception as log_exc:
+            if len(rows) == 1:
+                print(f"[AutomationRunLogger] Failed to log run: {log_exc}")
+                continue
+
+        # One bad row fails the whole multi-row INSERT; write them one at a
+        # time so only the bad run is lost.
+        for row in rows:
+            try:
+                insert_rows(schema_name, table_name, [row])
+            except Exception as log_exc:
+                print(f"[AutomationRunLogger] Failed to log run: {log_exc}")
+
+
+def _worker_loop() -> None:
+    while True:
+        item = _log_queue.get()
+        stop = item is None
+        batch = [] if stop else [item]
+
+        # Whatever queued up while the last batch was in flight goes out together.
+        while not stop and len(batch) < _MAX_BATCH_ROWS:
+            try:
+                item = _log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                stop = True
+            else:
+                batch.append(item)
+
+        _write_batch(batch)
+        if stop:
+            return
+
+
+def enqueue_row(schema_name: str, table_name: str, row: Tuple[Any, ...]) -> None:
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_worker_loop, name="AutomationRunLogger", daemon=True
+            )
+            _worker.start()
+    _log_queue.put((schema_name, table_name, row))
+
+
+def _drain() -> None:
+    """Flush queued runs and close the shared connection (runs at exit)."""
+    worker = _worker
+    if worker is not None and worker.is_alive():
+        try:
+            _log_queue.put(None, timeout=_DRAIN_TIMEOUT_S)
+        except queue.Full:
+            pass
+        worker.join(_DRAIN_TIMEOUT_S)
+
+    # Anything the worker didn't get to (or queued with no worker running).
+    leftovers = []
+    while True:
+        try:
+            item = _log_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is not None:
+            leftovers.append(item)
+
+    # A worker stuck in a hung warehouse call still holds the lock; don't let
+    # that hang interpreter exit.
+    if not _wh_lock.acquire(timeout=_DRAIN_TIMEOUT_S):
+        print(
+            "[AutomationRunLogger] Warehouse still busy at exit; "
+            f"{len(leftovers)} queued run(s) not logged."
+        )
+        return
+    try:
+        _write_batch(leftovers)
+        _close_warehouse()
+    finally:
+        _wh_lock.release()
+
+
+atexit.register(_drain)
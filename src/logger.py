@@ -1,19 +1,37 @@
 from __future__ import annotations
 
-import json
 import os
 import time
-import traceback
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
-
-from syncforge import WarehouseClient
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ._config import load_automation_config
 from ._host import get_host_context
 from ._json import jsonable
 from ._paths import resolve_entry_script_path, resolve_path
+from ._warehouse import encode_row, enqueue_row, insert_rows
+
+def _maybe_int(value: Any) -> Optional[int]:
+    """
+    An int, integral float (1234.0) or plain integer string (" -3") as int;
+    None for anything else. 12.9, True and "1_000" are rejected rather than
+    truncated/coerced.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if isinstance(value, str):
+        text = value.strip()
+        if text[:1] in ("+", "-"):
+            text = text[1:]
+        if not (text.isascii() and text.isdigit()):
+            return None
+        return int(value)
+    return None
 
 
 @dataclass
@@ -62,9 +80,13 @@ class AutomationRunLogger:
         """Create logger from config file, with optional overrides."""
         cfg = load_automation_config(config_path)
 
-        cfg_id = cfg.get("automation_id")
-        env_id = os.getenv("AUTOMATION_ID")
-        env_id = int(env_id) if env_id and env_id.isdigit() else None
+        raw_cfg_id = cfg.get("automation_id")
+        cfg_id = _maybe_int(raw_cfg_id)
+        if raw_cfg_id is not None and cfg_id is None:
+            raise ValueError(
+                f"automation_id in {config_path} must be an integer, got {raw_cfg_id!r}."
+            )
+        env_id = _maybe_int(os.getenv("AUTOMATION_ID"))
 
         final_id = (
             automation_id
@@ -80,6 +102,15 @@ class AutomationRunLogger:
         final_schema = schema_name or cfg.get("schema_name") or "automations"
         final_table = table_name or cfg.get("table_name") or "run_log"
 
+        # Names are sent as quoted identifiers, so they're case-sensitive; catch
+        # "Run_Log" here rather than as a failed insert on the background thread.
+        for label, name in (("schema_name", final_schema), ("table_name", final_table)):
+            if name != name.lower():
+                raise ValueError(
+                    f"{label} must be lower-case (got {name!r}); names are quoted, "
+                    "so upper-case letters won't match the warehouse table."
+                )
+
         entry_script_path = resolve_entry_script_path(script_path)
 
         final_path_mode = (path_mode or cfg.get("path_mode") or "script").strip().lower()
@@ -148,30 +179,34 @@ class AutomationRunLogger:
 
         self.flags[name] = existing
 
-    def _insert_row(self, success: bool, run_time: datetime, duration_ms: int) -> None:
-        output_json_str = json.dumps(self.output or {}, ensure_ascii=False)
-        context_json_str = json.dumps(self.context or {}, ensure_ascii=False)
-        flags_json_str = json.dumps(self.flags or {}, ensure_ascii=False)
-
-        sql = f"""
-            INSERT INTO {self.schema_name}.{self.table_name}
-                (automation_id, run_time, context, output, flags, success, duration_ms)
-            VALUES
-                (%s, %s, %s::jsonb, %s::jsonb, %s::jsonb, %s, %s);
+    @classmethod
+    def flush_batch(
+        cls,
+        rows: Iterable[
+            Tuple[int, datetime, Dict[str, Any], Dict[str, Any], Dict[str, Any], bool, int]
+        ],
+        schema_name: str = "automations",
+        table_name: str = "run_log",
+    ) -> None:
+        """
+        Insert many runs in one round trip.
+        Each row is (automation_id, run_time, context, output, flags, success, duration_ms),
+        with flags as built by add_flag.
         """
+        encoded: List[Tuple[Any, ...]] = [encode_row(*row) for row in rows]
+        insert_rows(schema_name, table_name, encoded)
 
-        params = (
+    def _insert_row(self, success: bool, run_time: datetime, duration_ms: int) -> None:
+        row = encode_row(
             self.automation_id,
             run_time,
-            context_json_str,
-            output_json_str,
-            flags_json_str,
+            self.context,
+            self.output,
+            self.flags,
             success,
             duration_ms,
         )
-
-        with WarehouseClient() as wh:
-            wh.execute_query(sql, params, fetch=False, commit=True)
+        enqueue_row(self.schema_name, self.table_name, row)
 
     def __enter__(self) -> "AutomationRunLogger":
         self._t0 = time.time()
@@ -183,12 +218,14 @@ class AutomationRunLogger:
         run_time = self._run_time or datetime.now(timezone.utc)
 
         if exc is not None:
+            from ._traceback import format_exception
+
             self._success = False
             self.output.setdefault("error", {})
             self.output["error"] = {
                 "type": getattr(exc_type, "__name__", str(exc_type)),
                 "message": str(exc),
-                "traceback": "".join(traceback.format_exception(exc_type, exc, tb)),
+                "traceback": format_exception(exc_type, exc, tb),
             }
 
         try:
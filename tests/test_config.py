@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src import _config
+from src._config import load_automation_config
+
+
+class LoadAutomationConfigTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "automation.config")
+        _config._CONFIG_CACHE.clear()
+        self.addCleanup(_config._CONFIG_CACHE.clear)
+
+    def _write(self, cfg, mtime_ns=None):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(cfg, f)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_missing_or_unstattable_paths_return_empty(self):
+        self.assertEqual(load_automation_config(self.path), {})
+        self._write({"automation_id": 1})
+        # a path that goes through a regular file raises NotADirectoryError
+        self.assertEqual(load_automation_config(os.path.join(self.path, "automation.config")), {})
+
+    def test_unchanged_file_is_served_from_cache(self):
+        self._write({"automation_id": 1})
+        self.assertEqual(load_automation_config(self.path), {"automation_id": 1})
+
+        real_open = open
+        opened = []
+
+        def counting_open(*args, **kwargs):
+            opened.append(args[0])
+            return real_open(*args, **kwargs)
+
+        with mock.patch("builtins.open", counting_open):
+            self.assertEqual(load_automation_config(self.path), {"automation_id": 1})
+        self.assertEqual(opened, [])
+
+    def test_mtime_change_invalidates(self):
+        self._write({"automation_id": 1}, mtime_ns=1_000_000_000)
+        load_automation_config(self.path)
+        self._write({"automation_id": 2}, mtime_ns=2_000_000_000)
+        self.assertEqual(load_automation_config(self.path), {"automation_id": 2})
+        self.assertEqual(len(_config._CONFIG_CACHE), 1)
+
+    def test_size_change_invalidates_even_with_same_mtime(self):
+        self._write({"automation_id": 1}, mtime_ns=1_000_000_000)
+        load_automation_config(self.path)
+        self._write({"automation_id": 12345}, mtime_ns=1_000_000_000)
+        self.assertEqual(load_automation_config(self.path), {"automation_id": 12345})
+
+    def test_each_call_returns_a_copy(self):
+        self._write({"automation_id": 1})
+        first = load_automation_config(self.path)
+        first["automation_id"] = 99
+        second = load_automation_config(self.path)
+        self.assertEqual(second, {"automation_id": 1})
+        self.assertIsNot(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import json
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from src import _json
+from src._json import dumps, jsonable
+
+
+class DumpsTests(unittest.TestCase):
+    def test_non_ascii_is_kept(self):
+        self.assertEqual(dumps({"name": "café"}), '{"name":"café"}')
+
+    def test_non_str_keys_are_stringified(self):
+        self.assertEqual(json.loads(dumps({1: "a"})), {"1": "a"})
+
+    def test_int_wider_than_64_bits_takes_json_fallback(self):
+        with mock.patch.object(_json.json, "dumps", wraps=json.dumps) as fallback:
+            encoded = dumps({"big": 2**70, "name": "café"})
+        fallback.assert_called_once()
+        self.assertEqual(json.loads(encoded), {"big": 2**70, "name": "café"})
+        self.assertIn("café", encoded)
+
+    def test_orjson_path_does_not_touch_fallback(self):
+        with mock.patch.object(_json.json, "dumps") as fallback:
+            dumps({"n": 2**63 - 1})
+        fallback.assert_not_called()
+
+
+class JsonableTests(unittest.TestCase):
+    def test_naive_datetime_is_treated_as_utc(self):
+        self.assertEqual(jsonable(datetime(2020, 1, 1)), "2020-01-01T00:00:00+00:00")
+        self.assertEqual(
+            jsonable(datetime(2020, 1, 1, tzinfo=timezone.utc)), "2020-01-01T00:00:00+00:00"
+        )
+
+    def test_subclasses_and_unknown_types(self):
+        class Name(str):
+            pass
+
+        self.assertEqual(jsonable(Name("x")), "x")
+        self.assertEqual(jsonable(True), True)
+        self.assertEqual(jsonable({1, 2}), "{1, 2}")
+
+
+if __name__ == "__main__":
+    unittest.main()
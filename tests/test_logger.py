@@ -0,0 +1,63 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src import AutomationRunLogger
+from src.logger import _maybe_int
+
+
+class MaybeIntTests(unittest.TestCase):
+    def test_accepted(self):
+        for value, expected in (
+            (12, 12),
+            (-3, -3),
+            (1234.0, 1234),
+            ("12", 12),
+            (" -3 ", -3),
+            ("+7", 7),
+        ):
+            with self.subTest(value=value):
+                self.assertEqual(_maybe_int(value), expected)
+
+    def test_rejected(self):
+        rejected = (None, 12.9, float("nan"), True, False, "1_000", "12.0", "", "abc", "١٢", [1])
+        for value in rejected:
+            with self.subTest(value=value):
+                self.assertIsNone(_maybe_int(value))
+
+
+class FromConfigTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.config_path = os.path.join(tmp.name, "automation.config")
+
+    def _from_config(self, cfg, **overrides):
+        with open(self.config_path, "w", encoding="utf-8") as f:
+            json.dump(cfg, f)
+        return AutomationRunLogger.from_config(self.config_path, **overrides)
+
+    def test_integral_float_id_is_accepted(self):
+        self.assertEqual(self._from_config({"automation_id": 1234.0}).automation_id, 1234)
+
+    def test_non_integer_config_id_raises(self):
+        for bad in (12.9, True, "1_000"):
+            with self.subTest(bad=bad), self.assertRaisesRegex(ValueError, "must be an integer"):
+                self._from_config({"automation_id": bad})
+
+    def test_upper_case_table_name_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "table_name must be lower-case"):
+            self._from_config({"automation_id": 1, "table_name": "Run_Log"})
+
+    def test_upper_case_schema_override_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "schema_name must be lower-case"):
+            self._from_config({"automation_id": 1}, schema_name="Automations")
+
+    def test_lower_case_names_are_used(self):
+        log = self._from_config({"automation_id": 1, "schema_name": "ops", "table_name": "runs"})
+        self.assertEqual((log.schema_name, log.table_name), ("ops", "runs"))
+
+
+if __name__ == "__main__":
+    unittest.main()
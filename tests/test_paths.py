@@ -0,0 +1,47 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run under `python -c`: __main__ has no __file__ and sys.argv[0] is "-c", so
+# only the stack-walk fallback is left, and every frame is either <string>,
+# the stdlib or this package.
+_NO_SCRIPT = """
+import json, os, sys
+sys.argv[0] = ""
+from src import AutomationRunLogger
+from src._paths import resolve_entry_script_path
+log = AutomationRunLogger.from_config("no-such-automation.config", automation_id=1)
+print(json.dumps([resolve_entry_script_path(), log.script_path,
+                  log.context["path_mode"], log.context["resolved_path"], os.getcwd()]))
+"""
+
+
+class ResolveEntryScriptPathTests(unittest.TestCase):
+    def test_no_main_file_and_empty_argv_falls_back_to_cwd(self):
+        out = subprocess.run(
+            [sys.executable, "-c", _NO_SCRIPT],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        entry, script_path, path_mode, resolved_path, cwd = json.loads(out)
+        self.assertIsNone(entry)
+        self.assertIsNone(script_path)
+        self.assertEqual(path_mode, "cwd")
+        self.assertEqual(resolved_path, cwd)
+
+    def test_explicit_path(self):
+        from src._paths import resolve_entry_script_path
+
+        self.assertEqual(resolve_entry_script_path(__file__), os.path.abspath(__file__))
+        self.assertIsNone(resolve_entry_script_path(os.path.join(REPO_ROOT, "missing.py")))
+
+
+if __name__ == "__main__":
+    unittest.main()
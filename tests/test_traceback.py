@@ -0,0 +1,133 @@
+import linecache
+import re
+import sys
+import traceback
+import unittest
+from unittest import mock
+
+from src._traceback import format_exception
+
+
+class CustomError(Exception):
+    pass
+
+
+def _raise_plain():
+    raise ValueError("plain")
+
+
+def _raise_from():
+    try:
+        _raise_plain()
+    except ValueError as e:
+        raise KeyError("from") from e
+
+
+def _raise_chain():
+    try:
+        _raise_from()
+    except KeyError:
+        raise CustomError("chained")
+
+
+def _raise_suppressed():
+    try:
+        _raise_plain()
+    except ValueError:
+        raise RuntimeError() from None
+
+
+def _raise_group():
+    errors = []
+    for exc in (ValueError("v1"), KeyError("k2")):
+        try:
+            raise exc
+        except Exception as e:
+            errors.append(e)
+    raise ExceptionGroup("eg", errors)
+
+
+def _raise_nested_group():
+    try:
+        _raise_group()
+    except ExceptionGroup as inner:
+        try:
+            _raise_from()
+        except KeyError as chained:
+            raise ExceptionGroup("outer", [inner, chained, RuntimeError("no tb")])
+
+
+def _recurse(n):
+    if n == 0:
+        raise RecursionError("deep")
+    return _recurse(n - 1)
+
+
+def _capture(fn, *args):
+    try:
+        fn(*args)
+    except BaseException:
+        return sys.exc_info()
+    raise AssertionError("expected an exception")
+
+
+# Optional exception-group margin ("  | ", "    + ") in front of a line.
+_MARGIN = re.compile(r"^(?: *[|+] )?")
+# Group separators ("  +-+---- 1 ----", "    +------") are kept as-is.
+_GROUP_RULE = re.compile(r"^ *\+[-+]")
+
+
+def _stdlib_without_source(exc_info):
+    # Source lines (and 3.11+ caret lines) are the only lines indented by 4
+    # once any exception-group margin is removed.
+    text = "".join(traceback.format_exception(*exc_info))
+    return "".join(
+        line
+        for line in text.splitlines(keepends=True)
+        if _GROUP_RULE.match(line) or not line[_MARGIN.match(line).end():].startswith("    ")
+    )
+
+
+class FormatExceptionTests(unittest.TestCase):
+    CASES = [
+        (_raise_plain,),
+        (_raise_from,),
+        (_raise_chain,),
+        (_raise_suppressed,),
+        (_recurse, 10),
+    ]
+    if sys.version_info >= (3, 11):
+        CASES += [(_raise_group,), (_raise_nested_group,)]
+
+    def test_matches_stdlib_minus_source_lines(self):
+        for case in self.CASES:
+            exc_info = _capture(*case)
+            with self.subTest(case[0].__name__):
+                self.assertEqual(format_exception(*exc_info), _stdlib_without_source(exc_info))
+
+    def test_never_reads_source(self):
+        exc_infos = [_capture(*case) for case in self.CASES]
+        with mock.patch.object(linecache, "getline") as getline, mock.patch.object(
+            linecache, "checkcache"
+        ) as checkcache, mock.patch.object(linecache, "getlines") as getlines:
+            for exc_info in exc_infos:
+                format_exception(*exc_info)
+        getline.assert_not_called()
+        getlines.assert_not_called()
+        checkcache.assert_not_called()
+
+    @unittest.skipIf(sys.version_info < (3, 11), "ExceptionGroup is 3.11+")
+    def test_group_keeps_sub_exceptions(self):
+        text = format_exception(*_capture(_raise_group))
+        self.assertIn("ExceptionGroup: eg (2 sub-exceptions)", text)
+        self.assertIn("ValueError: v1", text)
+        self.assertIn("KeyError: 'k2'", text)
+
+    def test_limit_caps_frames_per_exception(self):
+        exc_info = _capture(_recurse, 100)
+        text = format_exception(*exc_info, limit=2)
+        self.assertEqual(text.count('  File "'), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
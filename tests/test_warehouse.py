@@ -0,0 +1,263 @@
+import io
+import queue
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from unittest import mock
+
+from src import _warehouse
+
+
+class StubClient:
+    """Stands in for syncforge.WarehouseClient; records every statement."""
+
+    instances = []
+
+    def __init__(self):
+        self.queries = []
+        self.closed = False
+        self.broken = False
+        # sql/params -> exception to raise, checked per call
+        self.fail_if = lambda sql, params: None
+        StubClient.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+    def execute_query(self, sql, params=None, fetch=False, commit=False):
+        if self.broken:
+            raise ConnectionError("server closed the connection unexpectedly")
+        exc = self.fail_if(sql, params)
+        if exc is not None:
+            raise exc
+        self.queries.append((sql, params))
+
+    @property
+    def inserts(self):
+        return [params for sql, params in self.queries if sql.startswith("INSERT")]
+
+
+def _row(automation_id, output=None):
+    return _warehouse.encode_row(
+        automation_id, datetime.now(timezone.utc), {}, output or {}, {}, True, 1
+    )
+
+
+class EncodeRowTests(unittest.TestCase):
+    NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def test_bare_flags_go_to_flag_names_and_meta_flags_to_jsonb(self):
+        row = _warehouse.encode_row(
+            1,
+            self.NOW,
+            {"host": "a"},
+            {"rows": 3},
+            {"late": True, "skipped": {"count": 2}, "retried": True},
+            True,
+            5,
+        )
+        self.assertEqual(
+            row,
+            (
+                1,
+                self.NOW,
+                '{"host":"a"}',
+                '{"rows":3}',
+                '{"skipped":{"count":2}}',
+                ["late", "retried"],
+                True,
+                5,
+            ),
+        )
+
+    def test_only_meta_flags_leaves_flag_names_null(self):
+        row = _warehouse.encode_row(1, self.NOW, {}, {}, {"skipped": {"count": 2}}, True, 5)
+        self.assertEqual(row[4:6], ('{"skipped":{"count":2}}', None))
+
+    def test_only_bare_flags_leaves_flags_null(self):
+        row = _warehouse.encode_row(1, self.NOW, {}, {}, {"late": True}, True, 5)
+        self.assertEqual(row[4:6], (None, ["late"]))
+
+    def test_empty_payloads_are_null(self):
+        for empty in ({}, None):
+            row = _warehouse.encode_row(1, self.NOW, empty, empty, empty, False, 0)
+            self.assertEqual(row, (1, self.NOW, None, None, None, None, False, 0))
+
+    def test_wide_int_output_is_still_encoded(self):
+        row = _warehouse.encode_row(1, self.NOW, {}, {"big": 2**70}, {}, True, 0)
+        self.assertEqual(row[3], '{"big": 1180591620717411303424}')
+
+
+class WarehouseTestCase(unittest.TestCase):
+    def setUp(self):
+        StubClient.instances = []
+        _warehouse._close_warehouse()
+        patcher = mock.patch.object(_warehouse, "_WarehouseClient", StubClient)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(_warehouse._close_warehouse)
+
+
+class InsertRowsTests(WarehouseTestCase):
+    def test_reuses_one_connection(self):
+        _warehouse.insert_rows("automations", "run_log", [_row(1)])
+        _warehouse.insert_rows("automations", "run_log", [_row(2), _row(3)])
+        self.assertEqual(len(StubClient.instances), 1)
+        self.assertEqual([p[0] for p in StubClient.instances[0].inserts], [1, 2])
+
+    def test_stale_idle_connection_is_replaced_before_insert(self):
+        _warehouse.insert_rows("automations", "run_log", [_row(1)])
+        stale = StubClient.instances[0]
+        stale.broken = True
+        _warehouse._wh_last_used -= _warehouse._IDLE_CHECK_S + 1
+
+        _warehouse.insert_rows("automations", "run_log", [_row(2)])
+
+        self.assertTrue(stale.closed)
+        self.assertEqual(len(StubClient.instances), 2)
+        self.assertEqual([p[0] for p in StubClient.instances[1].inserts], [2])
+
+    def test_data_error_is_not_retried_and_keeps_connection(self):
+        bad = ValueError("unsupported Unicode escape sequence")
+        _warehouse._get_warehouse().fail_if = (
+            lambda sql, params: bad if sql.startswith("INSERT") else None
+        )
+
+        with self.assertRaises(ValueError):
+            _warehouse.insert_rows("automations", "run_log", [_row(1)])
+
+        self.assertEqual(len(StubClient.instances), 1)
+        self.assertFalse(StubClient.instances[0].closed)
+
+    def test_broken_connection_is_closed_without_replaying_insert(self):
+        client = _warehouse._get_warehouse()
+        attempts = []
+
+        def fail(sql, params):
+            if sql.startswith("INSERT"):
+                attempts.append(params)
+                client.broken = True
+                return ConnectionError("connection lost after commit")
+            return None
+
+        client.fail_if = fail
+        with self.assertRaises(ConnectionError):
+            _warehouse.insert_rows("automations", "run_log", [_row(1)])
+
+        self.assertEqual(len(attempts), 1)
+        self.assertTrue(client.closed)
+        self.assertIsNone(_warehouse._wh)
+
+
+class BackgroundQueueTests(WarehouseTestCase):
+    def setUp(self):
+        super().setUp()
+        # Fresh queue per test; _drain stops the worker and closes the client.
+        patcher = mock.patch.object(_warehouse, "_log_queue", queue.Queue(maxsize=100))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(_warehouse._drain)
+
+    def _inserted_ids(self):
+        ids = []
+        for client in StubClient.instances:
+            for params in client.inserts:
+                ids.extend(params[0::8])
+        return ids
+
+    def test_drain_writes_queued_rows_and_stops_worker(self):
+        for i in range(5):
+            _warehouse.enqueue_row("automations", "run_log", _row(i))
+        _warehouse._drain()
+
+        self.assertEqual(sorted(self._inserted_ids()), [0, 1, 2, 3, 4])
+        self.assertFalse(_warehouse._worker.is_alive())
+        self.assertTrue(StubClient.instances[-1].closed)
+
+    def test_rows_queued_while_busy_go_out_as_one_batch_per_table(self):
+        with _warehouse._wh_lock:  # hold the worker off while rows pile up
+            _warehouse.enqueue_row("automations", "t0", _row(0))
+            time.sleep(0.05)  # worker picks up row 0 and waits on the lock
+            for i, table in ((1, "t0"), (2, "t1"), (3, "t0")):
+                _warehouse.enqueue_row("automations", table, _row(i))
+        _warehouse._drain()
+
+        inserts = [
+            (sql.split("\n")[0], params[0::8])
+            for sql, params in StubClient.instances[0].queries
+            if sql.startswith("INSERT")
+        ]
+        self.assertEqual(
+            inserts,
+            [
+                ('INSERT INTO "automations"."t0"', (0,)),
+                ('INSERT INTO "automations"."t0"', (1, 3)),
+                ('INSERT INTO "automations"."t1"', (2,)),
+            ],
+        )
+
+    def test_bad_row_only_loses_itself(self):
+        bad = ValueError("unsupported Unicode escape sequence")
+        _warehouse._get_warehouse().fail_if = (
+            lambda sql, params: bad if params and 2 in params[0::8] else None
+        )
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            _warehouse._write_batch(
+                [("automations", "run_log", _row(i)) for i in (1, 2, 3)]
+            )
+
+        self.assertEqual(self._inserted_ids(), [1, 3])
+        self.assertEqual(out.getvalue().count("Failed to log run"), 1)
+
+    def test_full_queue_blocks_enqueue_until_worker_catches_up(self):
+        with mock.patch.object(_warehouse, "_log_queue", queue.Queue(maxsize=1)):
+            with _warehouse._wh_lock:
+                _warehouse.enqueue_row("automations", "run_log", _row(0))
+                time.sleep(0.05)  # worker holds row 0, waiting on the lock
+                _warehouse.enqueue_row("automations", "run_log", _row(1))  # fills queue
+
+                blocked = threading.Thread(
+                    target=_warehouse.enqueue_row, args=("automations", "run_log", _row(2))
+                )
+                blocked.start()
+                blocked.join(0.1)
+                self.assertTrue(blocked.is_alive())
+
+            blocked.join(2)
+            self.assertFalse(blocked.is_alive())
+            _warehouse._drain()
+
+        self.assertEqual(sorted(self._inserted_ids()), [0, 1, 2])
+
+    def test_drain_gives_up_when_worker_is_hung(self):
+        release = threading.Event()
+
+        def hung_warehouse_call():
+            with _warehouse._wh_lock:
+                release.wait()
+
+        hung = threading.Thread(target=hung_warehouse_call)
+        hung.start()
+        self.addCleanup(hung.join)
+        self.addCleanup(release.set)
+        time.sleep(0.02)
+
+        _warehouse.enqueue_row("automations", "run_log", _row(0))
+        out = io.StringIO()
+        start = time.monotonic()
+        with mock.patch.object(_warehouse, "_DRAIN_TIMEOUT_S", 0.1), redirect_stdout(out):
+            _warehouse._drain()
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertIn("Warehouse still busy at exit", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()